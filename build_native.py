@@ -0,0 +1,29 @@
+"""
+Build epf_calculator_native, an ahead-of-time compiled balance kernel.
+
+epf_calculator imports it when present, so calculate_monthly_balances runs
+as native code from the first call, with or without numba installed at run
+time. Building needs numba and a C compiler:
+
+    python build_native.py
+"""
+
+import os
+
+from numba.pycc import CC
+
+import epf_calculator
+
+# Registers the helpers the exported kernel calls
+epf_calculator._load_numba()
+
+cc = CC("epf_calculator_native")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.export("calc_balances", epf_calculator.CALC_BALANCES_SIGNATURE)(
+    epf_calculator._calc_balances_kernel
+)
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Built epf_calculator_native in {cc.output_dir}")
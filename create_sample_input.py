@@ -3,16 +3,32 @@ Create sample input file for EPF Report Generator.
 """
 
 import openpyxl
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment, colors
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
+
+THIN = Side(style="thin")
+BORDER = Border(left=THIN, right=THIN, top=THIN, bottom=THIN)
 
 
 def create_sample_input_file():
     """Create sample Input.xlsx with dummy data."""
 
-    workbook = openpyxl.Workbook()
+    header_font = Font(bold=True, size=11)
+    header_fill = PatternFill("solid", fgColor="D3D3D3")
+    centered = Alignment(horizontal="center", vertical="center")
+
+    def append_header(sheet, headers):
+        cells = []
+        for header in headers:
+            cell = WriteOnlyCell(sheet, value=header)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.border = BORDER
+            cell.alignment = centered
+            cells.append(cell)
+        sheet.append(cells)
 
-    # Remove default sheet
-    workbook.remove(workbook.active)
+    workbook = openpyxl.Workbook(write_only=True)
 
     # Create Wages sheet
     wages_sheet = workbook.create_sheet("Wages")
@@ -31,17 +47,7 @@ def create_sample_input_file():
         "Mar",
     ]
 
-    for col_idx, header in enumerate(headers_wages, start=1):
-        cell = wages_sheet.cell(row=1, column=col_idx, value=header)
-        cell.font = Font(bold=True, size=11)
-        cell.fill = PatternFill("solid", fgColor="D3D3D3")
-        cell.border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin"),
-        )
-        cell.alignment = Alignment(horizontal="center", vertical="center")
+    append_header(wages_sheet, headers_wages)
 
     # Add sample employee data
     sample_employees = [
@@ -127,64 +133,32 @@ def create_sample_input_file():
         ],
     ]
 
-    for row_idx, emp_data in enumerate(sample_employees, start=2):
-        for col_idx, value in enumerate(emp_data, start=1):
-            cell = wages_sheet.cell(row=row_idx, column=col_idx, value=value)
-            cell.alignment = Alignment(horizontal="center", vertical="center")
+    for emp_data in sample_employees:
+        wages_sheet.append(emp_data)
 
     # Create OB_EE sheet
     ob_ee_sheet = workbook.create_sheet("OB_EE")
-    cell = ob_ee_sheet.cell(row=1, column=1, value="OB(EE)")
-    cell.font = Font(bold=True, size=11)
-    cell.fill = PatternFill("solid", fgColor="D3D3D3")
-    cell.border = Border(
-        left=Side(style="thin"),
-        right=Side(style="thin"),
-        top=Side(style="thin"),
-        bottom=Side(style="thin"),
-    )
-    cell.alignment = Alignment(horizontal="center", vertical="center")
+    append_header(ob_ee_sheet, ["OB(EE)"])
 
     ob_ee_values = [50000, 60000, 40000, 65000, 75000]
-    for row_idx, value in enumerate(ob_ee_values, start=2):
-        cell = ob_ee_sheet.cell(row=row_idx, column=1, value=value)
-        cell.alignment = Alignment(horizontal="center", vertical="center")
+    for value in ob_ee_values:
+        ob_ee_sheet.append([value])
 
     # Create OB_ER sheet
     ob_er_sheet = workbook.create_sheet("OB_ER")
-    cell = ob_er_sheet.cell(row=1, column=1, value="OB(ER)")
-    cell.font = Font(bold=True, size=11)
-    cell.fill = PatternFill("solid", fgColor="D3D3D3")
-    cell.border = Border(
-        left=Side(style="thin"),
-        right=Side(style="thin"),
-        top=Side(style="thin"),
-        bottom=Side(style="thin"),
-    )
-    cell.alignment = Alignment(horizontal="center", vertical="center")
+    append_header(ob_er_sheet, ["OB(ER)"])
 
     ob_er_values = [15000, 18000, 12000, 19500, 22500]
-    for row_idx, value in enumerate(ob_er_values, start=2):
-        cell = ob_er_sheet.cell(row=row_idx, column=1, value=value)
-        cell.alignment = Alignment(horizontal="center", vertical="center")
+    for value in ob_er_values:
+        ob_er_sheet.append([value])
 
     # Create OB_EPS sheet
     ob_eps_sheet = workbook.create_sheet("OB_EPS")
-    cell = ob_eps_sheet.cell(row=1, column=1, value="OB(EPS)")
-    cell.font = Font(bold=True, size=11)
-    cell.fill = PatternFill("solid", fgColor="D3D3D3")
-    cell.border = Border(
-        left=Side(style="thin"),
-        right=Side(style="thin"),
-        top=Side(style="thin"),
-        bottom=Side(style="thin"),
-    )
-    cell.alignment = Alignment(horizontal="center", vertical="center")
+    append_header(ob_eps_sheet, ["OB(EPS)"])
 
     ob_eps_values = [35000, 42000, 28000, 45500, 52500]
-    for row_idx, value in enumerate(ob_eps_values, start=2):
-        cell = ob_eps_sheet.cell(row=row_idx, column=1, value=value)
-        cell.alignment = Alignment(horizontal="center", vertical="center")
+    for value in ob_eps_values:
+        ob_eps_sheet.append([value])
 
     # Create WDL_EE sheet
     wdl_ee_sheet = workbook.create_sheet("WDL_EE")
@@ -203,17 +177,7 @@ def create_sample_input_file():
         "Mar",
     ]
 
-    for col_idx, header in enumerate(wdl_headers, start=1):
-        cell = wdl_ee_sheet.cell(row=1, column=col_idx, value=header)
-        cell.font = Font(bold=True, size=11)
-        cell.fill = PatternFill("solid", fgColor="D3D3D3")
-        cell.border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin"),
-        )
-        cell.alignment = Alignment(horizontal="center", vertical="center")
+    append_header(wdl_ee_sheet, wdl_headers)
 
     wdl_ee_data = [
         [0, 0, 0, 5000, 0, 0, 0, 0, 0, 0, 0, 0],
@@ -223,25 +187,13 @@ def create_sample_input_file():
         [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
     ]
 
-    for row_idx, row_data in enumerate(wdl_ee_data, start=2):
-        for col_idx, value in enumerate(row_data, start=1):
-            cell = wdl_ee_sheet.cell(row=row_idx, column=col_idx, value=value)
-            cell.alignment = Alignment(horizontal="center", vertical="center")
+    for row_data in wdl_ee_data:
+        wdl_ee_sheet.append(row_data)
 
     # Create WDL_ER sheet
     wdl_er_sheet = workbook.create_sheet("WDL_ER")
 
-    for col_idx, header in enumerate(wdl_headers, start=1):
-        cell = wdl_er_sheet.cell(row=1, column=col_idx, value=header)
-        cell.font = Font(bold=True, size=11)
-        cell.fill = PatternFill("solid", fgColor="D3D3D3")
-        cell.border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin"),
-        )
-        cell.alignment = Alignment(horizontal="center", vertical="center")
+    append_header(wdl_er_sheet, wdl_headers)
 
     wdl_er_data = [
         [0, 0, 0, 1500, 0, 0, 0, 0, 0, 0, 0, 0],
@@ -251,14 +203,11 @@ def create_sample_input_file():
         [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
     ]
 
-    for row_idx, row_data in enumerate(wdl_er_data, start=2):
-        for col_idx, value in enumerate(row_data, start=1):
-            cell = wdl_er_sheet.cell(row=row_idx, column=col_idx, value=value)
-            cell.alignment = Alignment(horizontal="center", vertical="center")
+    for row_data in wdl_er_data:
+        wdl_er_sheet.append(row_data)
 
     # Save workbook
     workbook.save("InputFiles/Sample_Input.xlsx")
-    workbook.close()
     print("Sample Input.xlsx file created successfully in InputFiles directory.")
     print("\nSample data includes:")
     print(f"- 5 sample employees")
@@ -11,11 +11,32 @@ Features:
 """
 
 import csv
-import subprocess
+import functools
+import hashlib
+import os
+import pickle
+import sys
 import time
-from typing import List, Dict, Tuple, Union, Optional
+from typing import Callable, Iterable, List, Dict, Sequence, Tuple, Union, Optional
+import numpy as np
 import openpyxl
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment, colors
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
+from openpyxl.worksheet.worksheet import Worksheet
+
+# Optional: only used to speed up very large payrolls. Imported by
+# _load_numba once a kernel is actually needed.
+numba = None
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # Optional: faster .xlsx reader, openpyxl is used without it
+    CalamineWorkbook = None
+
+try:
+    from epf_calculator_native import calc_balances as _calc_balances_native
+except ImportError:  # Optional: ahead-of-time build made by build_native.py
+    _calc_balances_native = None
 
 
 class EPFCalculatorError(Exception):
@@ -43,27 +64,88 @@ class DataValidationError(EPFCalculatorError):
 
 
 # Constants
-EMPLOYEE_CONTRIBUTION_RATE = 0.12
-EPS_CONTRIBUTION_RATE = 0.0833
-EMPLOYER_CONTRIBUTION_RATE = 0.0367
+# Contribution rates in basis points, so shares round in integer arithmetic
+EMPLOYEE_CONTRIBUTION_BPS = 1200
+EPS_CONTRIBUTION_BPS = 833
+BPS_DIVISOR = 10000
 INTEREST_DIVISOR = 1200
 EXPECTED_WAGES_COLUMNS = 14
 EXPECTED_WDL_COLUMNS = 12
 EXPECTED_OB_COLUMNS = 1
+INPUT_SHEETS = ("Wages", "OB_EE", "OB_ER", "OB_EPS", "WDL_EE", "WDL_ER")
+OUTPUT_BUFFER_SIZE = 4 << 20
+# Below this many accounts NumPy finishes before the Numba kernel is loaded
+PARALLEL_THRESHOLD = 5000
+SLIP_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "epf_slips")
+# Part of every cache key; bump when a cached calculation changes
+SLIP_CACHE_VERSION = 1
+SLIP_HEADERS = (
+    "A/C No.",
+    "NAME",
+    "OB(EE)",
+    "OB(ER)",
+    "INT(EE)",
+    "INT(ER)",
+    "CONT(EE)",
+    "CONT(ER)",
+    "WDL(EE)",
+    "WDL(ER)",
+    "CB(EE)",
+    "CB(ER)",
+    "OB(EPS)",
+    "CONT(EPS)",
+    "CB(EPS)",
+)
+
+# ANSI escape sequences replacing the cmd.exe 'cls' and 'color' commands
+CLEAR_SCREEN = "\x1b[2J\x1b[H"
+COLOR_DEFAULT = "\x1b[0m"
+COLOR_NORMAL = "\x1b[92m"  # color 0A
+COLOR_ERROR = "\x1b[91m"  # color 0C
+COLOR_COMPLETED = "\x1b[30;105m"  # color D0
+
+# Output.xlsx header styles
+THIN = Side(style="thin")
+HEADER_FONT = Font(size=12, color="FFFF0000", italic=True, bold=True)
+HEADER_FILL = PatternFill("solid", fgColor="7FFFD4")
+HEADER_BORDER = Border(left=THIN, right=THIN, top=THIN, bottom=Side(style="double"))
+HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+
+
+def wait_for_key() -> None:
+    """Wait for a key press like 'pause >nul' (skipped when not interactive)."""
+    if not sys.stdin.isatty():
+        return
+    try:
+        import msvcrt
+    except ImportError:
+        input()
+    else:
+        msvcrt.getch()
+
+
+def set_title(title: str) -> None:
+    """Set the console window title."""
+    print(f"\x1b]0;{title}\x07", end="", flush=True)
+
+
+def set_color(color: str) -> None:
+    """Set the console text color to one of the COLOR_* sequences."""
+    print(color, end="", flush=True)
 
 
 def clear_screen_with_title(title: str) -> None:
-    """Clear console screen and set title (Windows only)."""
-    subprocess.call("pause >nul", shell=True)
-    subprocess.call("cls", shell=True)
-    subprocess.call(f"title={title}", shell=True)
+    """Clear console screen and set title."""
+    wait_for_key()
+    print(CLEAR_SCREEN, end="")
+    set_title(title)
     print(title + "\n")
 
 
 def start_up_check() -> str:
     """Display startup instructions and get user confirmation."""
     clear_screen_with_title("EPF Annual Account Slip Generator")
-    subprocess.call("color 0A", shell=True)
+    set_color(COLOR_NORMAL)
     print("Instructions:\n")
     print(
         "1. Make sure that you have filled all the sheets present in the 'Input.xlsx' "
@@ -80,17 +162,23 @@ def start_up_check() -> str:
 def open_input_excel_file(path: str) -> openpyxl.Workbook:
     """Load Excel workbook from specified path.
 
+    The workbook is opened read-only so sheets are streamed from the file
+    rather than parsed into an in-memory cell grid. Call ``close()`` on it
+    once the data has been fetched.
+
     Args:
         path: Path to Excel file
 
     Returns:
-        openpyxl.Workbook: Loaded workbook
+        openpyxl.Workbook: Loaded read-only workbook
 
     Raises:
         FileLoadError: If file cannot be loaded
     """
     try:
-        return openpyxl.load_workbook(path)
+        return openpyxl.load_workbook(
+            path, read_only=True, data_only=True, keep_links=False
+        )
     except FileNotFoundError:
         raise FileLoadError(f"File not found: {path}")
     except Exception as e:
@@ -113,186 +201,734 @@ def get_sheet(
         SheetNotFoundError: If sheet doesn't exist
     """
     try:
-        return workbook[sheet_name]
+        sheet = workbook[sheet_name]
     except KeyError:
         raise SheetNotFoundError(f"Sheet '{sheet_name}' not found in workbook")
 
+    # Read-only sheets take their size from the <dimension> tag, which some
+    # writers omit; scan the rows once to recover it.
+    if sheet.max_row is None or sheet.max_column is None:
+        sheet.calculate_dimension(force=True)
+    return sheet
+
 
-def validate_sheet_dimensions(
-    wage_sheet: openpyxl.worksheet.worksheet.Worksheet,
-    ob_ee_sheet: openpyxl.worksheet.worksheet.Worksheet,
-    ob_er_sheet: openpyxl.worksheet.worksheet.Worksheet,
-    ob_eps_sheet: openpyxl.worksheet.worksheet.Worksheet,
-    wdl_ee_sheet: openpyxl.worksheet.worksheet.Worksheet,
-    wdl_er_sheet: openpyxl.worksheet.worksheet.Worksheet,
-) -> None:
-    """Validate column and row counts for all sheets.
+def read_input_sheets(
+    path: str, sheet_names: Sequence[str] = INPUT_SHEETS
+) -> Dict[str, List[Sequence]]:
+    """Read the cell values of the input sheets.
+
+    Uses python-calamine when it is installed and falls back to openpyxl in
+    read-only mode otherwise.
 
     Args:
-        wage_sheet: Wages sheet
-        ob_ee_sheet: OB_EE sheet
-        ob_er_sheet: OB_ER sheet
-        ob_eps_sheet: OB_EPS sheet
-        wdl_ee_sheet: WDL_EE sheet
-        wdl_er_sheet: WDL_ER sheet
+        path: Path to Excel file
+        sheet_names: Sheets to read
+
+    Returns:
+        Rows of cell values per sheet name, header row first
 
     Raises:
-        DataValidationError: If validation fails
+        FileLoadError: If file cannot be loaded
+        SheetNotFoundError: If a sheet doesn't exist
     """
-    wage_sheet_row_count = wage_sheet.max_row
+    if CalamineWorkbook is not None:
+        return _read_sheets_calamine(path, sheet_names)
+    return _read_sheets_openpyxl(path, sheet_names)
 
-    # Column validation
-    if wage_sheet.max_column != EXPECTED_WAGES_COLUMNS:
-        raise DataValidationError(
-            f"In 'Wages' Sheet Expected {EXPECTED_WAGES_COLUMNS} columns, "
-            f"found {wage_sheet.max_column}."
-        )
-    if ob_ee_sheet.max_column != EXPECTED_OB_COLUMNS:
-        raise DataValidationError(
-            f"In 'OB_EE' Sheet Expected {EXPECTED_OB_COLUMNS} column, "
-            f"found {ob_ee_sheet.max_column}."
-        )
-    if ob_er_sheet.max_column != EXPECTED_OB_COLUMNS:
-        raise DataValidationError(
-            f"In 'OB_ER' Sheet Expected {EXPECTED_OB_COLUMNS} column, "
-            f"found {ob_er_sheet.max_column}."
-        )
-    if ob_eps_sheet.max_column != EXPECTED_OB_COLUMNS:
-        raise DataValidationError(
-            f"In 'OB_EPS' Sheet Expected {EXPECTED_OB_COLUMNS} column, "
-            f"found {ob_eps_sheet.max_column}."
-        )
-    if wdl_ee_sheet.max_column != EXPECTED_WDL_COLUMNS:
-        raise DataValidationError(
-            f"In 'WDL_EE' Sheet Expected {EXPECTED_WDL_COLUMNS} columns, "
-            f"found {wdl_ee_sheet.max_column}."
-        )
-    if wdl_er_sheet.max_column != EXPECTED_WDL_COLUMNS:
-        raise DataValidationError(
-            f"In 'WDL_ER' Sheet Expected {EXPECTED_WDL_COLUMNS} columns, "
-            f"found {wdl_er_sheet.max_column}."
-        )
 
-    # Row validation
-    if wage_sheet_row_count != ob_ee_sheet.max_row:
-        raise DataValidationError(
-            f"Row count mismatch: 'Wages' has {wage_sheet_row_count} rows, "
-            f"'OB_EE' has {ob_ee_sheet.max_row} rows."
-        )
-    if wage_sheet_row_count != ob_er_sheet.max_row:
-        raise DataValidationError(
-            f"Row count mismatch: 'Wages' has {wage_sheet_row_count} rows, "
-            f"'OB_ER' has {ob_er_sheet.max_row} rows."
-        )
-    if wage_sheet_row_count != ob_eps_sheet.max_row:
-        raise DataValidationError(
-            f"Row count mismatch: 'Wages' has {wage_sheet_row_count} rows, "
-            f"'OB_EPS' has {ob_eps_sheet.max_row} rows."
-        )
-    if wage_sheet_row_count != wdl_ee_sheet.max_row:
-        raise DataValidationError(
-            f"Row count mismatch: 'Wages' has {wage_sheet_row_count} rows, "
-            f"'WDL_EE' has {wdl_ee_sheet.max_row} rows."
-        )
-    if wage_sheet_row_count != wdl_er_sheet.max_row:
-        raise DataValidationError(
-            f"Row count mismatch: 'Wages' has {wage_sheet_row_count} rows, "
-            f"'WDL_ER' has {wdl_er_sheet.max_row} rows."
-        )
+def _read_sheets_calamine(
+    path: str, sheet_names: Sequence[str]
+) -> Dict[str, List[Sequence]]:
+    """Read sheets with python-calamine (see read_input_sheets)."""
+    if not os.path.exists(path):
+        raise FileLoadError(f"File not found: {path}")
+    try:
+        workbook = CalamineWorkbook.from_path(path)
+    except Exception as e:
+        raise FileLoadError(f"Failed to load workbook: {e}")
+
+    sheets = {}
+    with workbook:
+        for sheet_name in sheet_names:
+            if sheet_name not in workbook.sheet_names:
+                raise SheetNotFoundError(f"Sheet '{sheet_name}' not found in workbook")
+            # calamine reports every number as a float; give whole numbers back
+            # as ints, the way openpyxl returns them
+            sheets[sheet_name] = [
+                [
+                    (
+                        int(value)
+                        if isinstance(value, float) and value.is_integer()
+                        else value
+                    )
+                    for value in row
+                ]
+                for row in workbook.get_sheet_by_name(sheet_name).to_python()
+            ]
+    return sheets
 
 
-def fetch_sheet_data(
-    sheet: openpyxl.worksheet.worksheet.Worksheet, data_type: str
-) -> Union[List, List[List]]:
-    """Fetch data from sheet starting from row 2.
+def _read_sheets_openpyxl(
+    path: str, sheet_names: Sequence[str]
+) -> Dict[str, List[Sequence]]:
+    """Read sheets with openpyxl (see read_input_sheets)."""
+    workbook = open_input_excel_file(path)
+    try:
+        return {
+            sheet_name: list(
+                get_sheet(workbook, sheet_name).iter_rows(values_only=True)
+            )
+            for sheet_name in sheet_names
+        }
+    finally:
+        workbook.close()
+
+
+def load_and_validate(
+    rows: Iterable[Sequence],
+    sheet_name: str,
+    expected_columns: int,
+    data_type: str,
+) -> Tuple[Union[List, List[List]], int]:
+    """Validate the column count of a sheet and fetch its data in one pass.
 
     Args:
-        sheet: Worksheet to fetch data from
+        rows: Cell values of the sheet, header row first
+        sheet_name: Name of the sheet, used in error messages
+        expected_columns: Number of columns the sheet must have
         data_type: Type of data ('single' or 'multi')
 
     Returns:
-        List of values or List of lists
+        Tuple of (data from row 2 onwards, total row count including header)
+
+    Raises:
+        DataValidationError: If the column count does not match
     """
-    data = []
-    for row in range(2, sheet.max_row + 1):
-        if data_type == "single":
-            value = sheet.cell(row, 1).value
-            data.append(0 if value is None else value)
-        else:
-            row_data = []
-            for column in range(1, sheet.max_column + 1):
-                value = sheet.cell(row, column).value
-                row_data.append(0 if value is None else value)
-            data.append(row_data)
-    return data
+    rows = iter(rows)
+    header = next(rows, ())
+    if len(header) != expected_columns:
+        noun = "column" if expected_columns == 1 else "columns"
+        raise DataValidationError(
+            f"In '{sheet_name}' Sheet Expected {expected_columns} {noun}, "
+            f"found {len(header)}."
+        )
+
+    # Empty cells read as None from openpyxl and "" from calamine
+    if data_type == "single":
+        data = [0 if row[0] is None or row[0] == "" else row[0] for row in rows]
+    else:
+        data = [
+            [0 if value is None or value == "" else value for value in row]
+            for row in rows
+        ]
+    return data, len(data) + 1
+
+
+def validate_row_counts(row_counts: Dict[str, int]) -> None:
+    """Validate that every sheet has as many rows as the first one.
+
+    Args:
+        row_counts: Row count per sheet name, reference sheet first
+
+    Raises:
+        DataValidationError: If validation fails
+    """
+    (reference_name, reference_count), *others = row_counts.items()
+    for sheet_name, row_count in others:
+        if row_count != reference_count:
+            raise DataValidationError(
+                f"Row count mismatch: '{reference_name}' has {reference_count} "
+                f"rows, '{sheet_name}' has {row_count} rows."
+            )
+
+
+def _round_share(wage, bps):
+    """Share of a whole-rupee wage at a basis-point rate, rounded half up.
+
+    Works on ints and int64 arrays alike; _load_numba makes it callable from
+    the compiled kernels too.
+    """
+    return (wage * bps + BPS_DIVISOR // 2) // BPS_DIVISOR
 
 
 def calculate_contributions(wage: float) -> Tuple[int, int, int]:
     """Calculate EPF contributions from wage.
 
+    Wages are whole rupees and most months sit at the same few values (the
+    wage ceiling in particular), so results are cached per wage. Shares are
+    rounded half up to the rupee.
+
     Args:
         wage: Monthly wage amount
 
     Returns:
         Tuple of (employee_contribution, employer_contribution, eps_contribution)
     """
-    employee = round(wage * EMPLOYEE_CONTRIBUTION_RATE)
-    eps = round(wage * EPS_CONTRIBUTION_RATE)
-    employer = round(wage * EMPLOYER_CONTRIBUTION_RATE)
-    return employee, employer, eps
+    return _contributions(int(wage))
+
+
+@functools.lru_cache(maxsize=4096)
+def _contributions(wage: int) -> Tuple[int, int, int]:
+    """Cached body of calculate_contributions."""
+    employee = _round_share(wage, EMPLOYEE_CONTRIBUTION_BPS)
+    eps = _round_share(wage, EPS_CONTRIBUTION_BPS)
+    return employee, employee - eps, eps
+
+
+def calculate_contributions_batch(
+    wages: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Calculate EPF contributions for an array of wages.
+
+    The employer share is the employee share less EPS, so the three always
+    reconcile (employee == employer + eps) after rounding. Wages are
+    truncated to whole rupees, as in calculate_contributions.
+
+    Args:
+        wages: Monthly wage amounts, any shape
+
+    Returns:
+        Tuple of int64 arrays (employee, employer, eps), each shaped like wages
+    """
+    wages = np.asarray(wages).astype(np.int64)
+    employee = _round_share(wages, EMPLOYEE_CONTRIBUTION_BPS)
+    eps = _round_share(wages, EPS_CONTRIBUTION_BPS)
+    return employee, employee - eps, eps
+
+
+def _interest(interest_base, rate):
+    """Interest on an interest base, rounded to the rupee.
+
+    The base is the sum of the start-of-month balances less the year's
+    withdrawals. Like _round_share, usable from the compiled kernels.
+    """
+    return np.rint((interest_base * rate) / INTEREST_DIVISOR)
+
+
+def _closing_balance(opening, interest, contributions, withdrawals):
+    """Closing balance of one share from its annual figures."""
+    return opening + interest + contributions - withdrawals
+
+
+def _opening_balances(
+    opening: np.ndarray, contribs: np.ndarray, withdrawals: np.ndarray
+) -> np.ndarray:
+    """Balance at the start of each month, along the last axis.
+
+    The final month's movement only shows up in the closing balance, so it
+    is left out of the running sum.
+    """
+    months = max(contribs.shape[-1] - 1, 0)
+    running = np.cumsum(contribs[..., :months] - withdrawals[..., :months], axis=-1)
+    opening = np.asarray(opening)[..., None]
+    return np.concatenate((opening, opening + running), axis=-1)
+
+
+def _calc_balances_numpy(ob_ee, ob_er, ee_c, er_c, ee_w, er_w, rate):
+    """NumPy version of the balance kernels, for one account or a batch."""
+    ee_balances = _opening_balances(ob_ee, ee_c, ee_w)
+    er_balances = _opening_balances(ob_er, er_c, er_w)
+    ee_interest = _interest(ee_balances.sum(axis=-1) - ee_w.sum(axis=-1), rate)
+    er_interest = _interest(er_balances.sum(axis=-1) - er_w.sum(axis=-1), rate)
+    return ee_balances, er_balances, ee_interest, er_interest
+
+
+# Typed signature of the single-account kernel, also used by build_native.py
+CALC_BALANCES_SIGNATURE = (
+    "Tuple((float64[::1], float64[::1], float64, float64))"
+    "(float64, float64, float64[::1], float64[::1], float64[::1], float64[::1],"
+    " float64)"
+)
+
+
+def _fill_balances(opening, contribs, withdrawals, rate, balances):
+    """Write one share's start-of-month balances and return its interest.
+
+    Same arithmetic as _opening_balances, as a single scalar loop, for the
+    compiled kernels (see _load_numba).
+    """
+    months = balances.shape[0]
+    balance = opening
+    sum_balances = 0.0
+    for i in range(months):
+        balances[i] = balance
+        sum_balances += balance
+        if i < months - 1:
+            balance += contribs[i] - withdrawals[i]
+    return _interest(sum_balances - withdrawals.sum(), rate)
+
+
+def _calc_many_kernel(ob_ee, ob_er, ee_c, er_c, ee_w, er_w, rate):
+    """Numba kernel behind calculate_monthly_balances_many, parallel
+    across accounts. Wrapped by _load_numba."""
+    n = ee_c.shape[0]
+    months = max(ee_c.shape[1], 1)
+    ee_balances = np.empty((n, months))
+    er_balances = np.empty((n, months))
+    ee_interest = np.empty(n)
+    er_interest = np.empty(n)
+    for i in numba.prange(n):
+        ee_interest[i] = _fill_balances(
+            ob_ee[i], ee_c[i], ee_w[i], rate, ee_balances[i]
+        )
+        er_interest[i] = _fill_balances(
+            ob_er[i], er_c[i], er_w[i], rate, er_balances[i]
+        )
+    return ee_balances, er_balances, ee_interest, er_interest
+
+
+def _calc_balances_kernel(ob_ee, ob_er, ee_c, er_c, ee_w, er_w, rate):
+    """Numba kernel behind calculate_monthly_balances, compiled by
+    _balances_kernel and build_native.py."""
+    months = max(ee_c.shape[0], 1)
+    ee_balances = np.empty(months)
+    er_balances = np.empty(months)
+    ee_interest = _fill_balances(ob_ee, ee_c, ee_w, rate, ee_balances)
+    er_interest = _fill_balances(ob_er, er_c, er_w, rate, er_balances)
+    return ee_balances, er_balances, ee_interest, er_interest
+
+
+@functools.lru_cache(maxsize=None)
+def _balances_kernel():
+    """Implementation behind calculate_monthly_balances, chosen on first use.
+
+    The ahead-of-time build from build_native.py needs no compiling at all.
+    Otherwise the kernel is compiled for CALC_BALANCES_SIGNATURE (or loaded
+    from Numba's cache) here rather than at import, so programs that never
+    call calculate_monthly_balances don't pay for it.
+    """
+    if _calc_balances_native is not None:
+        return _calc_balances_native
+    if not _load_numba():
+        return _calc_balances_numpy
+    return numba.njit(CALC_BALANCES_SIGNATURE, cache=True, boundscheck=False)(
+        _calc_balances_kernel
+    )
+
+
+def _monthly_arrays(*monthly: np.ndarray) -> List[np.ndarray]:
+    """Convert monthly amounts to contiguous float64 arrays of one shape.
+
+    The compiled kernels don't bounds-check, so a short array would be read
+    past its end instead of raising.
+
+    Raises:
+        ValueError: If the arrays differ in shape
+    """
+    arrays = [np.ascontiguousarray(values, dtype=np.float64) for values in monthly]
+    if len({array.shape for array in arrays}) > 1:
+        shapes = ", ".join(str(array.shape) for array in arrays)
+        raise ValueError(f"Balance inputs differ in shape: {shapes}")
+    return arrays
 
 
 def calculate_monthly_balances(
-    ob_ee: int,
-    ob_er: int,
-    ee_contributions: List[int],
-    er_contributions: List[int],
-    ee_withdrawals: List[int],
-    er_withdrawals: List[int],
+    ob_ee: float,
+    ob_er: float,
+    ee_contribs: np.ndarray,
+    er_contribs: np.ndarray,
+    ee_withdrawals: np.ndarray,
+    er_withdrawals: np.ndarray,
     rate: float,
-) -> Tuple[List[int], List[int], int, int]:
+) -> Tuple[List[float], List[float], int, int]:
     """Calculate monthly balances and interest for employee and employer shares.
 
+    Runs as native code through Numba when it is installed. The monthly
+    amounts are used as-is when they are already contiguous float64 arrays;
+    any other sequence is converted first.
+
     Args:
         ob_ee: Opening balance for employee share
         ob_er: Opening balance for employer share
-        ee_contributions: Monthly employee contributions
-        er_contributions: Monthly employer contributions
-        ee_withdrawals: Monthly employee withdrawals
-        er_withdrawals: Monthly employer withdrawals
+        ee_contribs: Monthly employee contributions, float64 array
+        er_contribs: Monthly employer contributions, float64 array
+        ee_withdrawals: Monthly employee withdrawals, float64 array
+        er_withdrawals: Monthly employer withdrawals, float64 array
         rate: Annual interest rate
 
     Returns:
         Tuple of (ee_balances, er_balances, ee_interest, er_interest)
+
+    Raises:
+        ValueError: If the four monthly sequences differ in length
     """
-    ee_balances = [ob_ee]
-    er_balances = [ob_er]
-    current_ee_balance = ob_ee
-    current_er_balance = ob_er
-
-    for i in range(len(ee_contributions) - 1):
-        current_ee_balance = (
-            current_ee_balance + ee_contributions[i] - ee_withdrawals[i]
-        )
-        current_er_balance = (
-            current_er_balance + er_contributions[i] - er_withdrawals[i]
+    monthly = _monthly_arrays(ee_contribs, er_contribs, ee_withdrawals, er_withdrawals)
+    ee_balances, er_balances, ee_interest, er_interest = _balances_kernel()(
+        float(ob_ee), float(ob_er), *monthly, float(rate)
+    )
+
+    return (
+        ee_balances.tolist(),
+        er_balances.tolist(),
+        int(ee_interest),
+        int(er_interest),
+    )
+
+
+def calculate_monthly_balances_many(
+    ob_ee: np.ndarray,
+    ob_er: np.ndarray,
+    ee_contribs: np.ndarray,
+    er_contribs: np.ndarray,
+    ee_withdrawals: np.ndarray,
+    er_withdrawals: np.ndarray,
+    rate: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Calculate calculate_monthly_balances for many accounts at once.
+
+    Batches of PARALLEL_THRESHOLD accounts or more are spread across all
+    cores with Numba when it is installed.
+
+    Args:
+        ob_ee: Opening balances for employee share, shape (N,)
+        ob_er: Opening balances for employer share, shape (N,)
+        ee_contribs: Monthly employee contributions, shape (N, months)
+        er_contribs: Monthly employer contributions, shape (N, months)
+        ee_withdrawals: Monthly employee withdrawals, shape (N, months)
+        er_withdrawals: Monthly employer withdrawals, shape (N, months)
+        rate: Annual interest rate
+
+    Returns:
+        Tuple of float64 arrays (ee_balances, er_balances, ee_interest,
+        er_interest), balances shaped (N, months) and interest (N,)
+
+    Raises:
+        ValueError: If the monthly arrays differ in shape or the opening
+            balances don't have one entry per row
+    """
+    monthly = _monthly_arrays(ee_contribs, er_contribs, ee_withdrawals, er_withdrawals)
+    opening = _monthly_arrays(ob_ee, ob_er)
+    if monthly[0].ndim != 2 or opening[0].shape != monthly[0].shape[:1]:
+        raise ValueError(
+            f"Expected (N,) opening balances and (N, months) monthly amounts, "
+            f"got {opening[0].shape} and {monthly[0].shape}"
         )
-        ee_balances.append(current_ee_balance)
-        er_balances.append(current_er_balance)
 
-    sum_ee_balances = sum(ee_balances)
-    sum_er_balances = sum(er_balances)
-    total_ee_withdrawals = sum(ee_withdrawals)
-    total_er_withdrawals = sum(er_withdrawals)
+    kernels = _load_numba() if len(opening[0]) >= PARALLEL_THRESHOLD else None
+    calculate = kernels["balances_many"] if kernels else _calc_balances_numpy
+    return calculate(*opening, *monthly, float(rate))
+
+
+def calculate_interest_batch(
+    opening_balances: np.ndarray,
+    contributions: np.ndarray,
+    withdrawals: np.ndarray,
+    rate: float,
+) -> np.ndarray:
+    """Calculate interest for many accounts at once.
+
+    Vectorized form of the interest part of calculate_monthly_balances. The
+    running balances are never built: month m's movement is carried by the
+    (months - 1 - m) opening balances after it, so their sum is a weighted
+    sum of the monthly amounts.
+
+    Args:
+        opening_balances: Opening balance per account, shape (N,)
+        contributions: Monthly contributions, shape (N, months)
+        withdrawals: Monthly withdrawals, shape (N, months)
+        rate: Annual interest rate
+
+    Returns:
+        Interest per account as an int64 array of shape (N,)
+    """
+    months = contributions.shape[1]
+    weights = np.arange(months - 1, -1, -1)
+    # Withdrawals are also deducted once more from the interest base
+    interest_base = (
+        opening_balances * months
+        + contributions @ weights
+        - withdrawals @ (weights + 1)
+    )
+    return _interest(interest_base, rate).astype(np.int64)
+
 
-    ee_interest = round(
-        ((sum_ee_balances - total_ee_withdrawals) * rate) / INTEREST_DIVISOR
+def calculate_slips_batch(
+    wages: np.ndarray,
+    ob_ee: np.ndarray,
+    ob_er: np.ndarray,
+    ob_eps: np.ndarray,
+    ee_withdrawals: np.ndarray,
+    er_withdrawals: np.ndarray,
+    rate: float,
+) -> np.ndarray:
+    """Calculate the annual slip figures for many accounts at once.
+
+    Args:
+        wages: Monthly wages, shape (N, months)
+        ob_ee: Opening balances for employee share, shape (N,)
+        ob_er: Opening balances for employer share, shape (N,)
+        ob_eps: Opening balances for EPS, shape (N,)
+        ee_withdrawals: Monthly withdrawals from employee share, shape (N, months)
+        er_withdrawals: Monthly withdrawals from employer share, shape (N, months)
+        rate: Annual interest rate
+
+    Returns:
+        int64 array of shape (N, 13) with the numeric output columns in
+        SLIP_HEADERS order, starting at OB(EE)
+    """
+    ee_contribs, er_contribs, eps_contribs = calculate_contributions_batch(wages)
+
+    ee_interest = calculate_interest_batch(ob_ee, ee_contribs, ee_withdrawals, rate)
+    er_interest = calculate_interest_batch(ob_er, er_contribs, er_withdrawals, rate)
+
+    total_ee_contrib = ee_contribs.sum(axis=1)
+    total_er_contrib = er_contribs.sum(axis=1)
+    total_ee_wdl = ee_withdrawals.sum(axis=1)
+    total_er_wdl = er_withdrawals.sum(axis=1)
+    total_eps = eps_contribs.sum(axis=1)
+
+    cb_ee = _closing_balance(ob_ee, ee_interest, total_ee_contrib, total_ee_wdl)
+    cb_er = _closing_balance(ob_er, er_interest, total_er_contrib, total_er_wdl)
+    cb_eps = ob_eps + total_eps
+
+    return np.column_stack(
+        (
+            ob_ee,
+            ob_er,
+            ee_interest,
+            er_interest,
+            total_ee_contrib,
+            total_er_contrib,
+            total_ee_wdl,
+            total_er_wdl,
+            cb_ee,
+            cb_er,
+            ob_eps,
+            total_eps,
+            cb_eps,
+        )
     )
-    er_interest = round(
-        ((sum_er_balances - total_er_withdrawals) * rate) / INTEREST_DIVISOR
+
+
+def calculate_slip_from_wages(
+    ob_ee: int,
+    ob_er: int,
+    wages: np.ndarray,
+    ee_withdrawals: np.ndarray,
+    er_withdrawals: np.ndarray,
+    rate: float,
+) -> Tuple[int, int, int, int, int]:
+    """Calculate one account's interest and contribution totals from wages.
+
+    Fuses calculate_contributions and calculate_monthly_balances into one
+    pass over the months, with no intermediate contribution arrays. Called
+    directly it runs as plain Python; the parallel slip kernel compiles it
+    in (see _load_numba).
+
+    Args:
+        ob_ee: Opening balance for employee share
+        ob_er: Opening balance for employer share
+        wages: Monthly wages, int64 array
+        ee_withdrawals: Monthly employee withdrawals, int64 array
+        er_withdrawals: Monthly employer withdrawals, int64 array
+        rate: Annual interest rate
+
+    Returns:
+        Tuple of (ee_interest, er_interest, total_ee_contrib,
+        total_er_contrib, total_eps)
+    """
+    ee_balance = ob_ee
+    er_balance = ob_er
+    sum_ee_balances = 0
+    sum_er_balances = 0
+    total_ee_contrib = 0
+    total_er_contrib = 0
+    total_eps = 0
+    for m in range(wages.shape[0]):
+        wage = wages[m]
+        ee = _round_share(wage, EMPLOYEE_CONTRIBUTION_BPS)
+        eps = _round_share(wage, EPS_CONTRIBUTION_BPS)
+        er = ee - eps
+
+        # Interest accrues on the balance at the start of each month
+        sum_ee_balances += ee_balance
+        sum_er_balances += er_balance
+        ee_balance += ee - ee_withdrawals[m]
+        er_balance += er - er_withdrawals[m]
+
+        total_ee_contrib += ee
+        total_er_contrib += er
+        total_eps += eps
+
+    ee_interest = _interest(sum_ee_balances - ee_withdrawals.sum(), rate)
+    er_interest = _interest(sum_er_balances - er_withdrawals.sum(), rate)
+    return (
+        int(ee_interest),
+        int(er_interest),
+        total_ee_contrib,
+        total_er_contrib,
+        total_eps,
     )
 
-    return ee_balances, er_balances, ee_interest, er_interest
+
+def _calculate_slips_parallel(
+    wages, ob_ee, ob_er, ob_eps, ee_withdrawals, er_withdrawals, rate
+):
+    """Numba version of calculate_slips_batch, parallel across accounts.
+
+    Wrapped by _load_numba.
+    """
+    n = wages.shape[0]
+    slips = np.empty((n, 13), dtype=np.int64)
+    for i in numba.prange(n):
+        ee_interest, er_interest, total_ee_contrib, total_er_contrib, total_eps = (
+            calculate_slip_from_wages(
+                ob_ee[i],
+                ob_er[i],
+                wages[i],
+                ee_withdrawals[i],
+                er_withdrawals[i],
+                rate,
+            )
+        )
+        total_ee_wdl = ee_withdrawals[i].sum()
+        total_er_wdl = er_withdrawals[i].sum()
+
+        slips[i, 0] = ob_ee[i]
+        slips[i, 1] = ob_er[i]
+        slips[i, 2] = ee_interest
+        slips[i, 3] = er_interest
+        slips[i, 4] = total_ee_contrib
+        slips[i, 5] = total_er_contrib
+        slips[i, 6] = total_ee_wdl
+        slips[i, 7] = total_er_wdl
+        slips[i, 8] = _closing_balance(
+            ob_ee[i], ee_interest, total_ee_contrib, total_ee_wdl
+        )
+        slips[i, 9] = _closing_balance(
+            ob_er[i], er_interest, total_er_contrib, total_er_wdl
+        )
+        slips[i, 10] = ob_eps[i]
+        slips[i, 11] = total_eps
+        slips[i, 12] = ob_eps[i] + total_eps
+    return slips
+
+
+@functools.lru_cache(maxsize=None)
+def _load_numba() -> Optional[Dict[str, Callable]]:
+    """Import numba and wrap the parallel kernels, on first use.
+
+    Importing numba alone takes about half a second, longer than NumPy needs
+    for a payroll below PARALLEL_THRESHOLD accounts, so this only happens
+    once a caller actually wants a kernel. Compiled code is cached on disk
+    by Numba between runs.
+
+    The functions the kernels call are registered with register_jitable
+    rather than replaced, so the module's own names stay plain Python for
+    every other caller.
+
+    Returns:
+        The compiled kernels by name ("balances_many" for
+        calculate_monthly_balances_many, "slips" for generate_output_rows),
+        or None if numba is not installed
+    """
+    global numba
+    try:
+        import numba
+        from numba.extending import register_jitable
+    except ImportError:
+        return None
+
+    for helper in (
+        _round_share,
+        _interest,
+        _closing_balance,
+        _fill_balances,
+        calculate_slip_from_wages,
+    ):
+        register_jitable(helper)
+    return {
+        "balances_many": numba.njit(parallel=True, cache=True)(_calc_many_kernel),
+        "slips": numba.njit(parallel=True, cache=True)(_calculate_slips_parallel),
+    }
+
+
+def disk_memoize(func):
+    """Cache a pure function's results as pickles under SLIP_CACHE_DIR.
+
+    The cache key is a SHA-1 of the pickled function name and positional
+    arguments. A cache entry that can't be read back for any reason, or a
+    cache that can't be written, just means the function is called.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        key = hashlib.sha1(
+            pickle.dumps((SLIP_CACHE_VERSION, func.__qualname__, args))
+        ).hexdigest()
+        path = os.path.join(SLIP_CACHE_DIR, f"{key}.pkl")
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            # Missing, truncated, or pickled against code that has since changed
+            pass
+
+        result = func(*args)
+        try:
+            os.makedirs(SLIP_CACHE_DIR, exist_ok=True)
+            # Write then rename so a concurrent reader never sees half a file
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as f:
+                pickle.dump(result, f)
+            os.replace(temp_path, path)
+        except OSError:
+            pass
+        return result
+
+    return wrapper
+
+
+@disk_memoize
+def generate_annual_slip(employee_record: Tuple, rate: float) -> List[int]:
+    """Calculate the annual slip figures for a single account.
+
+    For recalculating individual accounts, e.g. after a payroll correction;
+    main computes the whole roster at once with generate_output_rows instead.
+    Results are cached on disk (see disk_memoize).
+
+    Args:
+        employee_record: Tuple of (wages, ob_ee, ob_er, ob_eps, ee_withdrawals,
+            er_withdrawals) with monthly sequences for wages and withdrawals
+        rate: Annual interest rate
+
+    Returns:
+        The numeric output columns in SLIP_HEADERS order, starting at OB(EE)
+    """
+    wages, ob_ee, ob_er, ob_eps, ee_withdrawals, er_withdrawals = employee_record
+    ob_ee, ob_er, ob_eps = int(ob_ee), int(ob_er), int(ob_eps)
+    ee_withdrawals = np.array(ee_withdrawals, dtype=np.int64)
+    er_withdrawals = np.array(er_withdrawals, dtype=np.int64)
+
+    slip = calculate_slip_from_wages(
+        ob_ee,
+        ob_er,
+        np.array(wages, dtype=np.int64),
+        ee_withdrawals,
+        er_withdrawals,
+        float(rate),
+    )
+    ee_interest, er_interest, total_ee_contrib, total_er_contrib, total_eps = (
+        int(value) for value in slip
+    )
+    total_ee_wdl = int(ee_withdrawals.sum())
+    total_er_wdl = int(er_withdrawals.sum())
+
+    return [
+        ob_ee,
+        ob_er,
+        ee_interest,
+        er_interest,
+        total_ee_contrib,
+        total_er_contrib,
+        total_ee_wdl,
+        total_er_wdl,
+        _closing_balance(ob_ee, ee_interest, total_ee_contrib, total_ee_wdl),
+        _closing_balance(ob_er, er_interest, total_er_contrib, total_er_wdl),
+        ob_eps,
+        total_eps,
+        ob_eps + total_eps,
+    ]
 
 
 def generate_output_rows(
@@ -306,6 +942,9 @@ def generate_output_rows(
 ) -> List[List]:
     """Generate output rows with all calculations.
 
+    Payrolls of PARALLEL_THRESHOLD accounts or more are computed with the
+    multi-core Numba kernel when numba is installed.
+
     Args:
         wage_sheet_data: Wage data (rows of monthly wages)
         ob_ee_data: Opening balances for employee share
@@ -316,98 +955,95 @@ def generate_output_rows(
         rate: Annual interest rate
 
     Returns:
-        List of output rows
+        List of output rows: a header row, then one row per account with
+        amounts as ints
     """
-    output_rows = [
-        [
-            "A/C No.",
-            "NAME",
-            "OB(EE)",
-            "OB(ER)",
-            "INT(EE)",
-            "INT(ER)",
-            "CONT(EE)",
-            "CONT(ER)",
-            "WDL(EE)",
-            "WDL(ER)",
-            "CB(EE)",
-            "CB(ER)",
-            "OB(EPS)",
-            "CONT(EPS)",
-            "CB(EPS)",
-        ]
-    ]
+    months = EXPECTED_WDL_COLUMNS
+
+    # Building int64 arrays directly truncates like int() without a float copy
+    wages = np.array(
+        [wage_row[2 : 2 + months] for wage_row in wage_sheet_data], dtype=np.int64
+    ).reshape(-1, months)
+    ob_ee = np.array(ob_ee_data, dtype=np.int64)
+    ob_er = np.array(ob_er_data, dtype=np.int64)
+    ob_eps = np.array(ob_eps_data, dtype=np.int64)
+    ee_withdrawals = np.array(wdl_ee_data, dtype=np.int64).reshape(-1, months)
+    er_withdrawals = np.array(wdl_er_data, dtype=np.int64).reshape(-1, months)
+
+    kernels = _load_numba() if len(wages) >= PARALLEL_THRESHOLD else None
+    calculate = kernels["slips"] if kernels else calculate_slips_batch
+    slips = calculate(
+        wages, ob_ee, ob_er, ob_eps, ee_withdrawals, er_withdrawals, rate
+    ).tolist()
+
+    output_rows = [list(SLIP_HEADERS)]
+    for wage_row, values in zip(wage_sheet_data, slips):
+        output_rows.append([wage_row[0], wage_row[1]] + values)
 
-    for i, wage_row in enumerate(wage_sheet_data):
-        account_no = wage_row[0]
-        name = wage_row[1]
-        monthly_wages = wage_row[2 : 2 + EXPECTED_WDL_COLUMNS]
-
-        ee_contribs = []
-        er_contribs = []
-        eps_contribs = []
-
-        for wage in monthly_wages:
-            ee, er, eps = calculate_contributions(wage)
-            ee_contribs.append(ee)
-            er_contribs.append(er)
-            eps_contribs.append(eps)
-
-        ob_ee = int(ob_ee_data[i])
-        ob_er = int(ob_er_data[i])
-        ob_eps = int(ob_eps_data[i])
-
-        ee_withdrawals = [int(x) for x in wdl_ee_data[i]]
-        er_withdrawals = [int(x) for x in wdl_er_data[i]]
+    return output_rows
 
-        ee_balances, er_balances, ee_interest, er_interest = calculate_monthly_balances(
-            ob_ee, ob_er, ee_contribs, er_contribs, ee_withdrawals, er_withdrawals, rate
-        )
 
-        total_ee_contrib = sum(ee_contribs)
-        total_er_contrib = sum(er_contribs)
-        total_ee_wdl = sum(ee_withdrawals)
-        total_er_wdl = sum(er_withdrawals)
-        total_eps = sum(eps_contribs)
-
-        cb_ee = ob_ee + ee_interest + total_ee_contrib - total_ee_wdl
-        cb_er = ob_er + er_interest + total_er_contrib - total_er_wdl
-        cb_eps = ob_eps + total_eps
-
-        output_rows.append(
-            [
-                account_no,
-                name,
-                str(ob_ee),
-                str(ob_er),
-                str(ee_interest),
-                str(er_interest),
-                str(total_ee_contrib),
-                str(total_er_contrib),
-                str(total_ee_wdl),
-                str(total_er_wdl),
-                str(cb_ee),
-                str(cb_er),
-                str(ob_eps),
-                str(total_eps),
-                str(cb_eps),
-            ]
-        )
+def _join_csv_rows(output_rows: List[List]) -> Optional[str]:
+    """Join rows into CSV text without quoting.
 
-    return output_rows
+    Returns None as soon as a row would come out differently from csv.writer,
+    so the caller can fall back to it: a field that needs quoting (it
+    contains a comma, quote or line break), a None field (written empty, not
+    as "None"), or a row that is one empty field (written as "").
+    """
+    lines = []
+    for row in output_rows:
+        line = ",".join(map(str, row))
+        if (
+            None in row
+            or (not line and len(row) == 1)
+            or line.count(",") != len(row) - 1
+            or '"' in line
+            or "\n" in line
+            or "\r" in line
+        ):
+            return None
+        lines.append(line)
+    lines.append("")
+    return "\r\n".join(lines)
 
 
 def write_csv_output(output_rows: List[List], filename: str = "output.csv") -> None:
     """Write output data to CSV file.
 
+    Rows are written as one joined string when no field needs quoting, the
+    usual case for slips that are mostly numbers; the output is the same as
+    csv.writer produces.
+
     Args:
         output_rows: List of rows to write
         filename: Output filename
     """
-    with open(filename, "w", newline="") as csvfile:
-        writer = csv.writer(csvfile, delimiter=",")
-        for row in output_rows:
-            writer.writerow(row)
+    text = _join_csv_rows(output_rows)
+    with open(filename, "w", newline="", buffering=OUTPUT_BUFFER_SIZE) as csvfile:
+        if text is None:
+            writer = csv.writer(csvfile, delimiter=",")
+            writer.writerows(output_rows)
+        else:
+            csvfile.write(text)
+
+
+def write_header(sheet: Worksheet, headers: List[str]) -> None:
+    """Append a styled header row to a write-only worksheet.
+
+    Args:
+        sheet: Worksheet to append to
+        headers: Header labels
+    """
+    cells = []
+    for header in headers:
+        cell = WriteOnlyCell(sheet, value=header)
+        cell.font = HEADER_FONT
+        cell.fill = HEADER_FILL
+        cell.border = HEADER_BORDER
+        cell.alignment = HEADER_ALIGNMENT
+        cells.append(cell)
+    sheet.append(cells)
 
 
 def write_excel_output(output_rows: List[List], filename: str = "Output.xlsx") -> None:
@@ -417,26 +1053,16 @@ def write_excel_output(output_rows: List[List], filename: str = "Output.xlsx") -
         output_rows: List of rows to write
         filename: Output filename
     """
-    workbook = openpyxl.Workbook()
-    sheet = workbook.active
-    sheet.title = "EPF Annual Account Slip"
-
-    for row_idx, row in enumerate(output_rows, start=1):
-        for col_idx, value in enumerate(row, start=1):
-            cell = sheet.cell(row=row_idx, column=col_idx, value=value)
-            if row_idx == 1:
-                cell.font = Font(size=12, color=colors.RED, italic=True, bold=True)
-                cell.fill = PatternFill("solid", fgColor="7FFFD4")
-                cell.border = Border(
-                    left=Side(style="thin"),
-                    right=Side(style="thin"),
-                    top=Side(style="thin"),
-                    bottom=Side(style="double"),
-                )
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-
-    workbook.save(filename)
-    workbook.close()
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("EPF Annual Account Slip")
+
+    write_header(sheet, output_rows[0])
+    for row in output_rows[1:]:
+        sheet.append(row)
+
+    # zipfile issues many small writes while compressing the sheet XML
+    with open(filename, "wb", buffering=OUTPUT_BUFFER_SIZE) as xlsxfile:
+        workbook.save(xlsxfile)
 
 
 def main() -> Optional[str]:
@@ -448,49 +1074,46 @@ def main() -> Optional[str]:
     path_of_file = "InputFiles/Input.xlsx"
 
     try:
-        input_workbook = open_input_excel_file(path_of_file)
+        sheets = read_input_sheets(path_of_file)
         print("Successfully Loaded the 'Input.xlsx' File.\n")
-
-        wage_sheet = get_sheet(input_workbook, "Wages")
-        print("Successfully Loaded the 'Wages' Sheet.")
-
-        ob_ee_sheet = get_sheet(input_workbook, "OB_EE")
-        print("Successfully Loaded the 'OB_EE' Sheet.")
-
-        ob_er_sheet = get_sheet(input_workbook, "OB_ER")
-        print("Successfully Loaded the 'OB_ER' Sheet.")
-
-        ob_eps_sheet = get_sheet(input_workbook, "OB_EPS")
-        print("Successfully Loaded the 'OB_EPS' Sheet.")
-
-        wdl_ee_sheet = get_sheet(input_workbook, "WDL_EE")
-        print("Successfully Loaded the 'WDL_EE' Sheet.")
-
-        wdl_er_sheet = get_sheet(input_workbook, "WDL_ER")
-        print("Successfully Loaded the 'WDL_ER' Sheet.")
+        for sheet_name in INPUT_SHEETS:
+            print(f"Successfully Loaded the '{sheet_name}' Sheet.")
 
         print("\nAll Sheets Loaded Successfully!")
 
         clear_screen_with_title("Validating Data...")
-        validate_sheet_dimensions(
-            wage_sheet,
-            ob_ee_sheet,
-            ob_er_sheet,
-            ob_eps_sheet,
-            wdl_ee_sheet,
-            wdl_er_sheet,
+        wage_sheet_data, wage_rows = load_and_validate(
+            sheets["Wages"], "Wages", EXPECTED_WAGES_COLUMNS, "multi"
+        )
+        ob_ee_data, ob_ee_rows = load_and_validate(
+            sheets["OB_EE"], "OB_EE", EXPECTED_OB_COLUMNS, "single"
+        )
+        ob_er_data, ob_er_rows = load_and_validate(
+            sheets["OB_ER"], "OB_ER", EXPECTED_OB_COLUMNS, "single"
+        )
+        ob_eps_data, ob_eps_rows = load_and_validate(
+            sheets["OB_EPS"], "OB_EPS", EXPECTED_OB_COLUMNS, "single"
+        )
+        wdl_ee_data, wdl_ee_rows = load_and_validate(
+            sheets["WDL_EE"], "WDL_EE", EXPECTED_WDL_COLUMNS, "multi"
         )
-        print("Data Validation Successful!\n")
+        wdl_er_data, wdl_er_rows = load_and_validate(
+            sheets["WDL_ER"], "WDL_ER", EXPECTED_WDL_COLUMNS, "multi"
+        )
+        validate_row_counts(
+            {
+                "Wages": wage_rows,
+                "OB_EE": ob_ee_rows,
+                "OB_ER": ob_er_rows,
+                "OB_EPS": ob_eps_rows,
+                "WDL_EE": wdl_ee_rows,
+                "WDL_ER": wdl_er_rows,
+            }
+        )
+        print("Data Validation Successful!")
+        print("Data Fetched Successfully.\n")
 
         clear_screen_with_title("Processing Data...")
-        wage_sheet_data = fetch_sheet_data(wage_sheet, "multi")
-        ob_ee_data = fetch_sheet_data(ob_ee_sheet, "single")
-        ob_er_data = fetch_sheet_data(ob_er_sheet, "single")
-        ob_eps_data = fetch_sheet_data(ob_eps_sheet, "single")
-        wdl_ee_data = fetch_sheet_data(wdl_ee_sheet, "multi")
-        wdl_er_data = fetch_sheet_data(wdl_er_sheet, "multi")
-
-        print("Data Fetched Successfully.\n")
         rate = float(input("Enter the Rate of Interest for the Year: "))
 
         print("\nCalculating EPF Contributions and Interest...")
@@ -512,32 +1135,32 @@ def main() -> Optional[str]:
         write_excel_output(output_rows)
         print("Successfully Generated 'Output.xlsx'")
 
-        input_workbook.close()
-
         return "SUCCESS"
 
     except EPFCalculatorError as e:
-        subprocess.call("color 0C", shell=True)
+        set_color(COLOR_ERROR)
         print(f"\n####\nERROR: {e}")
         return "ERROR"
     except Exception as e:
-        subprocess.call("color 0C", shell=True)
+        set_color(COLOR_ERROR)
         print(f"\n####\nUNEXPECTED ERROR: {e}")
         return "ERROR"
 
 
 if __name__ == "__main__":
     starttime = time.time()
+    if os.name == "nt":
+        # Enables ANSI escape processing in the Windows 10+ console
+        os.system("")
 
     result = main()
 
-    if result == "CLOSE":
-        subprocess.call("exit", shell=True)
-    elif result == "SUCCESS":
-        subprocess.call("title=!!!Program Completed!!!", shell=True)
-        subprocess.call("color D0", shell=True)
+    if result == "SUCCESS":
+        set_title("!!!Program Completed!!!")
+        set_color(COLOR_COMPLETED)
         print(f"\nTotal Time Taken: {time.time() - starttime:.2f} Seconds")
         print("!!!Program Completed!!!")
-        subprocess.call("pause >nul", shell=True)
-    else:
-        subprocess.call("pause >nul", shell=True)
+        wait_for_key()
+    elif result == "ERROR":
+        wait_for_key()
+    set_color(COLOR_DEFAULT)
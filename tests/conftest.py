@@ -0,0 +1,52 @@
+"""Shared fixtures for the EPF Calculator tests."""
+
+import openpyxl
+import pytest
+
+MONTHS = [
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+    "Jan",
+    "Feb",
+    "Mar",
+]
+
+SAMPLE_SHEETS = {
+    "Wages": [
+        ["A/C No.", "NAME"] + MONTHS,
+        ["EPF001", "John Doe"] + [15000] * 12,
+        ["EPF002", "Jane Smith"] + [18000, 18500] * 6,
+    ],
+    "OB_EE": [["OB(EE)"], [50000], [60000]],
+    "OB_ER": [["OB(ER)"], [15000], [18000]],
+    "OB_EPS": [["OB(EPS)"], [35000], [42000]],
+    "WDL_EE": [MONTHS, [0, 0, 0, 5000] + [0] * 8, [0] * 12],
+    "WDL_ER": [MONTHS, [0, 0, 0, 1500] + [0] * 8, [0] * 12],
+}
+
+
+@pytest.fixture(scope="session")
+def sample_sheets():
+    """Cell values of every sheet in sample_workbook, header row first."""
+    return SAMPLE_SHEETS
+
+
+@pytest.fixture(scope="session")
+def sample_workbook(tmp_path_factory):
+    """Path to a minimal Input.xlsx with SAMPLE_SHEETS, written once per session."""
+    workbook = openpyxl.Workbook(write_only=True)
+    for sheet_name, rows in SAMPLE_SHEETS.items():
+        sheet = workbook.create_sheet(sheet_name)
+        for row in rows:
+            sheet.append(row)
+
+    path = tmp_path_factory.mktemp("input") / "Input.xlsx"
+    workbook.save(path)
+    return str(path)
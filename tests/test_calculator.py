@@ -1,9 +1,25 @@
 """Test suite for EPF Calculator."""
 
+import csv
+import io
+from decimal import ROUND_HALF_UP, Decimal
+
+import numpy as np
 import pytest
+import epf_calculator
 from epf_calculator import (
     calculate_contributions,
+    calculate_contributions_batch,
+    calculate_interest_batch,
     calculate_monthly_balances,
+    calculate_monthly_balances_many,
+    calculate_slip_from_wages,
+    generate_annual_slip,
+    generate_output_rows,
+    load_and_validate,
+    read_input_sheets,
+    validate_row_counts,
+    write_csv_output,
     EPFCalculatorError,
     FileLoadError,
     SheetNotFoundError,
@@ -11,42 +27,92 @@ from epf_calculator import (
 )
 
 
+class TestReadInputSheets:
+    """Test reading and validating the input workbook."""
+
+    @pytest.mark.parametrize("reader", ["calamine", "openpyxl"])
+    def test_reads_all_sheets(
+        self, monkeypatch, sample_workbook, sample_sheets, reader
+    ):
+        """Test both readers return the cell values of every sheet."""
+        if reader == "calamine":
+            pytest.importorskip("python_calamine")
+        else:
+            monkeypatch.setattr(epf_calculator, "CalamineWorkbook", None)
+        sheets = read_input_sheets(sample_workbook)
+        assert {
+            name: [list(row) for row in rows] for name, rows in sheets.items()
+        } == sample_sheets
+
+    def test_missing_file(self, tmp_path):
+        """Test a missing workbook raises FileLoadError."""
+        with pytest.raises(FileLoadError):
+            read_input_sheets(str(tmp_path / "missing.xlsx"))
+
+    @pytest.mark.parametrize("reader", ["calamine", "openpyxl"])
+    def test_missing_sheet(self, monkeypatch, sample_workbook, reader):
+        """Test both readers raise SheetNotFoundError for an absent sheet."""
+        if reader == "calamine":
+            pytest.importorskip("python_calamine")
+        else:
+            monkeypatch.setattr(epf_calculator, "CalamineWorkbook", None)
+        with pytest.raises(SheetNotFoundError, match="WDL_EPS"):
+            read_input_sheets(sample_workbook, ["WDL_EPS"])
+
+    def test_load_and_validate(self, sample_workbook):
+        """Test data rows and row count are returned after the header."""
+        sheets = read_input_sheets(sample_workbook, ["OB_EE"])
+        assert load_and_validate(sheets["OB_EE"], "OB_EE", 1, "single") == (
+            [50000, 60000],
+            3,
+        )
+
+    def test_load_and_validate_column_mismatch(self, sample_workbook):
+        """Test a sheet with the wrong width raises DataValidationError."""
+        sheets = read_input_sheets(sample_workbook, ["WDL_EE"])
+        with pytest.raises(DataValidationError, match="Expected 14 columns"):
+            load_and_validate(sheets["WDL_EE"], "WDL_EE", 14, "multi")
+
+
 class TestCalculateContributions:
     """Test EPF contribution calculations."""
 
-    def test_employee_contribution(self):
-        """Test employee contribution is 12% of wage."""
-        ee, er, eps = calculate_contributions(10000)
-        assert ee == 1200
-
-    def test_eps_contribution(self):
-        """Test EPS contribution is 8.33% of wage."""
-        ee, er, eps = calculate_contributions(10000)
-        assert eps == 833
-
-    def test_employer_contribution(self):
-        """Test employer contribution is 3.67% of wage."""
-        ee, er, eps = calculate_contributions(10000)
-        assert er == 367
-
-    def test_total_ee_contribution(self):
-        """Test total equals 12% of wage."""
-        ee, er, eps = calculate_contributions(10000)
-        assert ee == er + eps
-
-    def test_rounding(self):
-        """Test values are properly rounded."""
-        ee, er, eps = calculate_contributions(10001)
-        assert ee == 1200
-        assert eps == 833
-        assert er == 367
-
-    def test_zero_wage(self):
-        """Test calculation with zero wage."""
-        ee, er, eps = calculate_contributions(0)
-        assert ee == 0
-        assert er == 0
-        assert eps == 0
+    @pytest.mark.parametrize(
+        "wage, ee, er, eps",
+        [
+            (10000, 1200, 367, 833),
+            (10001, 1200, 367, 833),
+            (0, 0, 0, 0),
+            (25000, 3000, 917, 2083),
+        ],
+    )
+    def test_contributions(self, wage, ee, er, eps):
+        """Test 12% employee share, 8.33% EPS, remainder to employer."""
+        assert calculate_contributions(wage) == (ee, er, eps)
+
+    def test_matches_decimal_rounding(self):
+        """Test shares against decimal half-up rounding for every wage below 100k."""
+        wages = range(100_000)
+        ee, er, eps = calculate_contributions_batch(np.array(wages))
+
+        def oracle(rate):
+            return [
+                int((Decimal(w) * Decimal(rate)).quantize(0, rounding=ROUND_HALF_UP))
+                for w in wages
+            ]
+
+        assert ee.tolist() == oracle("0.12")
+        assert eps.tolist() == oracle("0.0833")
+        assert (er >= 0).all()
+
+    def test_batch_matches_scalar(self):
+        """Test batch contributions agree with the scalar version."""
+        wages = np.array([[0, 5, 6, 13], [10000, 10001, 15000, 20500]])
+        ee, er, eps = calculate_contributions_batch(wages)
+        assert ee.dtype == np.int64
+        assert ee.shape == wages.shape
+        for w, expected in zip(wages.ravel(), zip(ee.ravel(), er.ravel(), eps.ravel())):
+            assert calculate_contributions(w) == expected
 
 
 class TestCalculateMonthlyBalances:
@@ -57,10 +123,10 @@ class TestCalculateMonthlyBalances:
         ee_balances, er_balances, ee_int, er_int = calculate_monthly_balances(
             ob_ee=10000,
             ob_er=3000,
-            ee_contributions=[1000, 1000],
-            er_contributions=[300, 300],
-            ee_withdrawals=[0, 0],
-            er_withdrawals=[0, 0],
+            ee_contribs=np.array([1000, 1000], dtype=np.float64),
+            er_contribs=np.array([300, 300], dtype=np.float64),
+            ee_withdrawals=np.array([0, 0], dtype=np.float64),
+            er_withdrawals=np.array([0, 0], dtype=np.float64),
             rate=8.5,
         )
         assert ee_balances[-1] == 11000
@@ -71,58 +137,294 @@ class TestCalculateMonthlyBalances:
         ee_balances, er_balances, ee_int, er_int = calculate_monthly_balances(
             ob_ee=10000,
             ob_er=3000,
-            ee_contributions=[1000, 1000],
-            er_contributions=[300, 300],
-            ee_withdrawals=[500, 0],
-            er_withdrawals=[150, 0],
+            ee_contribs=np.array([1000, 1000], dtype=np.float64),
+            er_contribs=np.array([300, 300], dtype=np.float64),
+            ee_withdrawals=np.array([500, 0], dtype=np.float64),
+            er_withdrawals=np.array([150, 0], dtype=np.float64),
             rate=8.5,
         )
         assert ee_balances[-1] == 10500
         assert er_balances[-1] == 3150
 
     def test_interest_calculation(self):
-        """Test interest is calculated correctly."""
+        """Test interest is charged on the start-of-month balances."""
         ee_balances, er_balances, ee_int, er_int = calculate_monthly_balances(
             ob_ee=12000,
             ob_er=3600,
-            ee_contributions=[1000],
-            er_contributions=[300],
-            ee_withdrawals=[0],
-            er_withdrawals=[0],
+            ee_contribs=np.array([1000], dtype=np.float64),
+            er_contribs=np.array([300], dtype=np.float64),
+            ee_withdrawals=np.array([0], dtype=np.float64),
+            er_withdrawals=np.array([0], dtype=np.float64),
             rate=8.5,
         )
-        assert ee_balances[-1] == 11000
-        assert er_balances[-1] == 3300
+        # Only the opening balance is held at the start of the one month,
+        # so this year's contribution earns nothing: 12000 * 8.5 / 1200 = 85
+        # and 3600 * 8.5 / 1200 = 25.5 -> 26 (ties to even)
+        assert ee_int == 85
+        assert er_int == 26
 
-    def test_with_withdrawals(self):
-        """Test balance calculation with withdrawals."""
-        ee_balances, er_balances, ee_int, er_int = calculate_monthly_balances(
-            ob_ee=10000,
-            ob_er=3000,
-            ee_contribs=[1000, 1000],
-            er_contribs=[300, 300],
-            ee_withdrawals=[500, 0],
-            er_withdrawals=[150, 0],
+    def test_length_mismatch(self):
+        """Test monthly sequences of different lengths are rejected."""
+        with pytest.raises(ValueError, match="differ in shape"):
+            calculate_monthly_balances(0, 0, [1, 2, 3], [1, 2, 3], [1], [1], 8.5)
+
+
+class TestCalculateMonthlyBalancesMany:
+    """Test monthly balances for many accounts at once."""
+
+    @staticmethod
+    def _arguments():
+        contribs = np.array([[1000, 1000, 1000], [1200, 1300, 1400]])
+        withdrawals = np.array([[0, 500, 0], [0, 0, 0]])
+        return (
+            np.array([10000, 20000]),
+            np.array([3000, 6000]),
+            contribs,
+            contribs // 3,
+            withdrawals,
+            withdrawals,
+            8.5,
+        )
+
+    def test_matches_single_account(self):
+        """Test each row matches calculate_monthly_balances."""
+        ee_balances, er_balances, ee_int, er_int = calculate_monthly_balances_many(
+            *self._arguments()
+        )
+        ob_ee, ob_er, ee_c, er_c, ee_w, er_w, rate = self._arguments()
+        for i in range(len(ob_ee)):
+            expected = calculate_monthly_balances(
+                ob_ee[i], ob_er[i], ee_c[i], er_c[i], ee_w[i], er_w[i], rate
+            )
+            assert expected == (
+                ee_balances[i].tolist(),
+                er_balances[i].tolist(),
+                ee_int[i],
+                er_int[i],
+            )
+
+    def test_parallel_kernel_matches_numpy(self, monkeypatch):
+        """Test the Numba kernel produces the same results as NumPy."""
+        pytest.importorskip("numba")
+        expected = calculate_monthly_balances_many(*self._arguments())
+        monkeypatch.setattr("epf_calculator.PARALLEL_THRESHOLD", 0)
+        result = calculate_monthly_balances_many(*self._arguments())
+        for actual, wanted in zip(result, expected):
+            np.testing.assert_array_equal(actual, wanted)
+
+
+class TestCalculateInterestBatch:
+    """Test vectorized interest calculation."""
+
+    def test_matches_monthly_balances(self):
+        """Test batch interest agrees with the per-account calculation."""
+        ob = np.array([10000, 3000])
+        contribs = np.array([[1000, 1000, 1000], [300, 300, 300]])
+        withdrawals = np.array([[500, 0, 0], [0, 150, 0]])
+        interest = calculate_interest_batch(ob, contribs, withdrawals, rate=8.5)
+        for i in range(2):
+            _, _, expected, _ = calculate_monthly_balances(
+                int(ob[i]),
+                0,
+                contribs[i].tolist(),
+                [0, 0, 0],
+                withdrawals[i].tolist(),
+                [0, 0, 0],
+                8.5,
+            )
+            assert interest[i] == expected
+
+
+class TestCalculateSlipFromWages:
+    """Test the fused contributions and balances pass."""
+
+    def test_matches_split_functions(self):
+        """Test results agree with calculate_contributions + balances."""
+        wages = np.array([15000, 25000, 18500, 0, 20000, 25000], dtype=np.int64)
+        ee_w = np.array([0, 0, 5000, 0, 0, 0], dtype=np.int64)
+        er_w = np.array([0, 0, 1500, 0, 0, 0], dtype=np.int64)
+        ee_c, er_c, eps_c = zip(*(calculate_contributions(w) for w in wages))
+        _, _, ee_int, er_int = calculate_monthly_balances(
+            50000, 15000, ee_c, er_c, ee_w, er_w, 8.5
+        )
+        assert calculate_slip_from_wages(50000, 15000, wages, ee_w, er_w, 8.5) == (
+            ee_int,
+            er_int,
+            sum(ee_c),
+            sum(er_c),
+            sum(eps_c),
+        )
+
+
+class TestGenerateOutputRows:
+    """Test full slip generation."""
+
+    @staticmethod
+    def _generate():
+        wages = [
+            ["EPF001", "John Doe"] + [15000] * 12,
+            ["EPF002", "Jane Smith"] + [18000, 18500] * 6,
+        ]
+        withdrawals = [[0, 0, 0, 5000] + [0] * 8, [0] * 12]
+        return generate_output_rows(
+            wages,
+            [50000, 60000],
+            [15000, 18000],
+            [35000, 42000],
+            withdrawals,
+            withdrawals,
             rate=8.5,
         )
-        assert ee_balances[-1] == 10500
-        assert er_balances[-1] == 3150
 
-    def test_interest_calculation(self):
-        """Test interest is calculated correctly."""
-        ee_balances, er_balances, ee_int, er_int = calculate_monthly_balances(
-            ob_ee=12000,
-            ob_er=3600,
-            ee_contribs=[1000],
-            er_contribs=[300],
-            ee_withdrawals=[0],
-            er_withdrawals=[0],
+    def test_parallel_kernel_matches_numpy(self, monkeypatch):
+        """Test the Numba kernel produces the same slips as NumPy."""
+        pytest.importorskip("numba")
+        expected = self._generate()
+        monkeypatch.setattr("epf_calculator.PARALLEL_THRESHOLD", 0)
+        assert self._generate() == expected
+
+    @pytest.mark.parametrize("kernel", ["numpy", "numba"])
+    def test_sample_rows(self, monkeypatch, sample_sheets, kernel):
+        """Test the slips for the sample workbook against hand-computed values."""
+        if kernel == "numba":
+            pytest.importorskip("numba")
+            monkeypatch.setattr("epf_calculator.PARALLEL_THRESHOLD", 0)
+        rows = generate_output_rows(
+            sample_sheets["Wages"][1:],
+            [row[0] for row in sample_sheets["OB_EE"][1:]],
+            [row[0] for row in sample_sheets["OB_ER"][1:]],
+            [row[0] for row in sample_sheets["OB_EPS"][1:]],
+            sample_sheets["WDL_EE"][1:],
+            sample_sheets["WDL_ER"][1:],
             rate=8.5,
         )
-        # Average balance: (12000 + 13000) / 2 = 12500
-        # Interest: (12500 * 8.5) / 1200 = 88.54 -> 89
-        assert ee_int == 89
-        assert er_int == 26
+        # EPF001: 1800 EE / 550 ER / 1250 EPS a month, July withdrawals.
+        # Start-of-month EE balances sum to 678800; less the 5000 withdrawn,
+        # 673800 * 8.5 / 1200 = 4772.75 -> 4773. ER: 202800 * 8.5 / 1200 =
+        # 1436.5 -> 1436 (ties to even).
+        assert rows[1] == [
+            "EPF001",
+            "John Doe",
+            50000,
+            15000,
+            4773,
+            1436,
+            21600,
+            6600,
+            5000,
+            1500,
+            71373,
+            21536,
+            35000,
+            15000,
+            50000,
+        ]
+        # EPF002: wages alternate 18000 / 18500, giving 2160 / 2220 EE and
+        # 1499 / 1541 EPS. EE base 720000 + 2160 * 36 + 2220 * 30 = 864360
+        # -> 6122.55 -> 6123; ER base 216000 + 661 * 36 + 679 * 30 = 260166
+        # -> 1842.84 -> 1843.
+        assert rows[2] == [
+            "EPF002",
+            "Jane Smith",
+            60000,
+            18000,
+            6123,
+            1843,
+            26280,
+            8040,
+            0,
+            0,
+            92403,
+            27883,
+            42000,
+            18240,
+            60240,
+        ]
+
+    def test_annual_slip_values(self, monkeypatch, tmp_path):
+        """Test the single-account entry point against hand-computed values."""
+        monkeypatch.setattr("epf_calculator.SLIP_CACHE_DIR", str(tmp_path))
+        # A March withdrawal is deducted from the interest base but never
+        # sits in a start-of-month balance: 1200 * 12 + 1800 * 66 = 133200
+        # EE, less 2400 -> 130800 * 8.5 / 1200 = 926.5 -> 926 (ties to
+        # even). ER: 550 * 66 = 36300, less 600 -> 252.875 -> 253.
+        record = ([15000] * 12, 1200, 0, 0, [0] * 11 + [2400], [0] * 11 + [600])
+        assert generate_annual_slip(record, 8.5) == [
+            1200,
+            0,
+            926,
+            253,
+            21600,
+            6600,
+            2400,
+            600,
+            21326,
+            6253,
+            0,
+            15000,
+            15000,
+        ]
+
+    def test_annual_slip_matches_batch(self, monkeypatch, tmp_path):
+        """Test the single-account entry point agrees with the batch rows."""
+        monkeypatch.setattr("epf_calculator.SLIP_CACHE_DIR", str(tmp_path))
+        withdrawals = [0, 0, 0, 5000] + [0] * 8
+        record = ([15000] * 12, 50000, 15000, 35000, withdrawals, withdrawals)
+        assert generate_annual_slip(record, 8.5) == self._generate()[1][2:]
+
+    def test_annual_slip_cached_on_disk(self, monkeypatch, tmp_path):
+        """Test a repeated slip is read back from the cache directory."""
+        monkeypatch.setattr("epf_calculator.SLIP_CACHE_DIR", str(tmp_path))
+        record = ([18000] * 12, 60000, 18000, 42000, [0] * 12, [0] * 12)
+        first = generate_annual_slip(record, 8.5)
+        assert len(list(tmp_path.glob("*.pkl"))) == 1
+
+        monkeypatch.setattr("epf_calculator.calculate_slip_from_wages", None)
+        assert generate_annual_slip(record, 8.5) == first
+
+    def test_annual_slip_unreadable_cache(self, monkeypatch, tmp_path):
+        """Test a corrupt cache entry is recomputed rather than raised."""
+        monkeypatch.setattr("epf_calculator.SLIP_CACHE_DIR", str(tmp_path))
+        record = ([18000] * 12, 60000, 18000, 42000, [0] * 12, [0] * 12)
+        first = generate_annual_slip(record, 8.5)
+        (cache_file,) = tmp_path.glob("*.pkl")
+        cache_file.write_bytes(b"cnot_a_module\nattr\n.")
+
+        assert generate_annual_slip(record, 8.5) == first
+
+
+class TestWriteCsvOutput:
+    """Test CSV output."""
+
+    @pytest.mark.parametrize(
+        "rows",
+        [
+            [["A/C No.", "NAME", "CB(EE)"], ["EPF001", "John Doe", 71622]],
+            [["A/C No.", "NAME", "CB(EE)"], ["EPF002", 'Smith, "Jane"', 92279]],
+            [["A/C No.", "NAME", "CB(EE)"], ["EPF003", None, 0]],
+            [["A/C No."], [""], [None]],
+        ],
+    )
+    def test_matches_csv_writer(self, tmp_path, rows):
+        """Test output is identical to csv.writer, including fallback cases."""
+        expected = io.StringIO(newline="")
+        csv.writer(expected).writerows(rows)
+        path = tmp_path / "output.csv"
+        write_csv_output(rows, str(path))
+        assert path.read_bytes() == expected.getvalue().encode()
+
+
+class TestValidateRowCounts:
+    """Test cross-sheet row count validation."""
+
+    def test_matching_counts(self):
+        """Test matching row counts pass validation."""
+        validate_row_counts({"Wages": 6, "OB_EE": 6, "WDL_ER": 6})
+
+    def test_mismatched_counts(self):
+        """Test a mismatch names the offending sheet."""
+        with pytest.raises(DataValidationError, match="'OB_ER' has 5 rows"):
+            validate_row_counts({"Wages": 6, "OB_EE": 6, "OB_ER": 5})
 
 
 class TestExceptions: